@@ -10,7 +10,7 @@ else:
     router = SimpleRouter()
 
 router.register("users", UserViewSet)
-router.register("fem", FEMViewSet)
+router.register("fem", FEMViewSet, basename="fem")
 
 
 app_name = "api"
@@ -6,4 +6,10 @@ from onlinefem.fem.models import FEM
 class FEMSerializer(serializers.ModelSerializer):
     class Meta:
         model = FEM
-        fields = ('id', 'name', 'email', 'message')
+        fields = ('id', 'name')
+
+
+class FEMListSerializer(serializers.Serializer):
+    """Read-only serializer skipping the ModelSerializer introspection."""
+    id = serializers.IntegerField(read_only=True)
+    name = serializers.CharField(read_only=True)
@@ -1,23 +1,52 @@
-from rest_framework import status
+from rest_framework import permissions, status
 from rest_framework.decorators import action
 from rest_framework.mixins import (ListModelMixin, RetrieveModelMixin,
                                    UpdateModelMixin)
+from rest_framework.pagination import PageNumberPagination
 from rest_framework.response import Response
 from rest_framework.viewsets import GenericViewSet
 
 from onlinefem.fem.models import FEM
-from .serializers import FEMSerializer
+from .serializers import FEMListSerializer, FEMSerializer
+
+
+class FEMPagination(PageNumberPagination):
+    page_size = 100
 
 
 class FEMViewSet(RetrieveModelMixin, ListModelMixin, UpdateModelMixin,
                  GenericViewSet):
     serializer_class = FEMSerializer
-    queryset = FEM.objects.all()
+    pagination_class = FEMPagination
+    # Only load the columns rendered by the serializer.
+    only_fields = FEMSerializer.Meta.fields
+    select_related_fields = ()
+    prefetch_related_fields = ()
+    # Actions only reading data use the lighter, non-model serializer. Other
+    # methods, such as the browsable API's PUT form, keep FEMSerializer.
+    read_actions = ('list', 'retrieve', 'fem')
 
     def get_queryset(self, *args, **kwargs):
-        return self.queryset
+        queryset = FEM.objects.only(*self.only_fields).order_by('id')
+        if self.select_related_fields:
+            queryset = queryset.select_related(*self.select_related_fields)
+        if self.prefetch_related_fields:
+            queryset = queryset.prefetch_related(
+                *self.prefetch_related_fields)
+        return queryset
+
+    def get_serializer_class(self):
+        if (self.request.method in permissions.SAFE_METHODS
+                and self.action in self.read_actions):
+            return FEMListSerializer
+        return self.serializer_class
 
     @action(detail=False, methods=["GET"])
     def fem(self, request):
-        serializer = FEMSerializer()
+        queryset = self.get_queryset()
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            serializer = self.get_serializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
+        serializer = self.get_serializer(queryset, many=True)
         return Response(status=status.HTTP_200_OK, data=serializer.data)
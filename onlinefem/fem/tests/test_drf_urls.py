@@ -0,0 +1,11 @@
+from django.urls import resolve, reverse
+
+
+def test_fem_list():
+    assert reverse("api:fem-list") == "/api/fem/"
+    assert resolve("/api/fem/").view_name == "api:fem-list"
+
+
+def test_fem_fem():
+    assert reverse("api:fem-fem") == "/api/fem/fem/"
+    assert resolve("/api/fem/fem/").view_name == "api:fem-fem"
@@ -0,0 +1,85 @@
+import pytest
+from django.test import RequestFactory
+from rest_framework.test import APIClient, force_authenticate
+
+from onlinefem.fem.api.serializers import FEMListSerializer, FEMSerializer
+from onlinefem.fem.api.views import FEMViewSet
+from onlinefem.fem.models import FEM
+from onlinefem.users.models import User
+
+pytestmark = pytest.mark.django_db
+
+
+class TestFEMViewSet:
+    def test_get_queryset(self, user: User, rf: RequestFactory):
+        fem = FEM.objects.create(name="numbers")
+        view = FEMViewSet()
+        request = rf.get("/fake-url/")
+        request.user = user
+
+        view.request = request
+        queryset = view.get_queryset()
+
+        assert fem in queryset
+        assert queryset.first().get_deferred_fields() == {"created_at"}
+
+    def test_fem(self, user: User, rf: RequestFactory):
+        fem = FEM.objects.create(name="numbers")
+        view = FEMViewSet.as_view({"get": "fem"})
+        request = rf.get("/fake-url/")
+        force_authenticate(request, user=user)
+
+        response = view(request)
+
+        assert response.data["results"] == [{"id": fem.id, "name": fem.name}]
+
+    def test_list_renders_json(self, user: User):
+        fem = FEM.objects.create(name="numbers")
+        client = APIClient()
+        client.force_authenticate(user=user)
+
+        response = client.get("/api/fem/")
+
+        assert response.status_code == 200
+        assert response["Content-Type"] == "application/json"
+        assert response.json() == {
+            "count": 1,
+            "next": None,
+            "previous": None,
+            "results": [{"id": fem.id, "name": fem.name}],
+        }
+
+    def test_get_serializer_class(self, rf: RequestFactory):
+        view = FEMViewSet()
+        view.request = rf.get("/fake-url/")
+
+        for action in ("list", "retrieve", "fem"):
+            view.action = action
+            assert view.get_serializer_class() is FEMListSerializer
+
+        # The browsable API builds its PUT form with the retrieve action.
+        view.request = rf.put("/fake-url/")
+        view.action = "retrieve"
+        assert view.get_serializer_class() is FEMSerializer
+
+        view.request = rf.patch("/fake-url/")
+        view.action = "partial_update"
+        assert view.get_serializer_class() is FEMSerializer
+
+    def test_serializer_fields(self):
+        assert tuple(FEMListSerializer().fields) == FEMSerializer.Meta.fields
+        assert FEMViewSet.only_fields == FEMSerializer.Meta.fields
+
+    def test_partial_update_validates(self, user: User):
+        fem = FEM.objects.create(name="numbers")
+        client = APIClient()
+        client.force_authenticate(user=user)
+
+        response = client.patch(
+            f"/api/fem/{fem.id}/", {"name": "x" * 101}, format="json"
+        )
+
+        assert response.status_code == 400
+        assert "name" in response.json()
+        fem.refresh_from_db()
+        assert fem.name == "numbers"
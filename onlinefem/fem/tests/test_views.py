@@ -0,0 +1,90 @@
+import json
+from unittest.mock import Mock
+
+import pytest
+from django.test import RequestFactory
+
+from onlinefem.fem import views
+from onlinefem.fem.views import NUMBERS_OUT, dolfin_view
+
+# Copy of what femdolfinx.app.index answers to a POST asking for
+# ``numbers``. femdolfinx needs dolfinx and runs in its own container, so it
+# cannot be imported here: this copy must be updated by hand if index
+# changes, and the tests below cannot detect such a change.
+FEMDOLFINX_NUMBERS = {"numbers": list(range(10)), "method": "POST"}
+
+
+@pytest.fixture
+def upstream(monkeypatch) -> Mock:
+    post = Mock(return_value=Mock(**{"json.return_value": FEMDOLFINX_NUMBERS}))
+    monkeypatch.setattr(views._SESSION, "post", post)
+    return post
+
+
+def test_numbers_out(rf: RequestFactory, upstream: Mock):
+    # The general path computes the same answer from the femdolfinx payload.
+    response = dolfin_view(rf.get("/fake-url/", {"nocache": "1"}))
+
+    upstream.assert_called_once()
+    assert json.loads(response.content) == {"out": NUMBERS_OUT}
+
+
+def test_dolfin_view_numbers(rf: RequestFactory, upstream: Mock):
+    request = rf.get("/fake-url/")
+
+    response = dolfin_view(request)
+
+    assert response.status_code == 200
+    assert json.loads(response.content) == {"out": NUMBERS_OUT}
+    upstream.assert_not_called()
+
+
+def test_dolfin_view_unknown_name(rf: RequestFactory, upstream: Mock):
+    request = rf.get("/fake-url/", {"name": "junk"})
+
+    response = dolfin_view(request)
+
+    assert response.status_code == 400
+    upstream.assert_not_called()
+
+
+def test_dolfin_view_not_modified(rf: RequestFactory):
+    response = dolfin_view(rf.get("/fake-url/"))
+    request = rf.get("/fake-url/", HTTP_IF_NONE_MATCH=response["ETag"])
+
+    response = dolfin_view(request)
+
+    assert response.status_code == 304
+    assert "public" in response["Cache-Control"]
+
+
+def test_dolfin_view_nocache_not_modified(rf: RequestFactory, upstream: Mock):
+    response = dolfin_view(rf.get("/fake-url/"))
+    request = rf.get(
+        "/fake-url/", {"nocache": "1"}, HTTP_IF_NONE_MATCH=response["ETag"]
+    )
+
+    response = dolfin_view(request)
+
+    assert response.status_code == 200
+    upstream.assert_called_once()
+    assert not response.has_header("ETag")
+    assert "no-cache" in response["Cache-Control"]
+    assert "public" not in response["Cache-Control"]
+
+
+def test_dolfin_view_control_character_name(rf: RequestFactory, upstream: Mock):
+    request = rf.get("/fake-url/", {"name": "a\nb"})
+
+    response = dolfin_view(request)
+
+    assert response.status_code == 400
+    assert not response.has_header("ETag")
+    upstream.assert_not_called()
+
+
+def test_dolfin_view_nocache_zero(rf: RequestFactory, upstream: Mock):
+    response = dolfin_view(rf.get("/fake-url/", {"nocache": "0"}))
+
+    upstream.assert_not_called()
+    assert json.loads(response.content) == {"out": NUMBERS_OUT}
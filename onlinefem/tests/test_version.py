@@ -0,0 +1,10 @@
+from onlinefem import __version__, __version_info__
+
+
+def test_version_info():
+    # Same rules as the parser __version_info__ replaced: the first "-" is
+    # a separator and non-numeric parts are kept as strings.
+    parts = __version__.replace("-", ".", 1).split(".")
+    assert __version_info__ == tuple(
+        int(part) if part.isdigit() else part for part in parts
+    )
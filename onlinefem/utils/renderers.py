@@ -0,0 +1,27 @@
+import orjson
+from rest_framework.renderers import JSONRenderer
+
+
+class OrjsonRenderer(JSONRenderer):
+    """JSONRenderer encoding with orjson.
+
+    Non-str dict keys, such as the list indexes DRF uses in ListField
+    errors, are converted to strings and U+2028/U+2029 are escaped as
+    JSONRenderer does. Unlike JSONRenderer with STRICT_JSON, NaN and
+    infinite floats are rendered as ``null`` instead of raising.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        renderer_context = renderer_context or {}
+        option = orjson.OPT_NON_STR_KEYS
+        if self.get_indent(accepted_media_type, renderer_context):
+            option |= orjson.OPT_INDENT_2
+        # Fall back on DRF's encoder for types orjson does not handle, such
+        # as lazy translation strings and decimals.
+        ret = orjson.dumps(data, default=self.encoder_class().default, option=option)
+        # These are valid JSON but not valid JavaScript, see JSONRenderer.
+        return ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(
+            b"\xe2\x80\xa9", b"\\u2029"
+        )
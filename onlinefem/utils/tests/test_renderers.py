@@ -0,0 +1,50 @@
+from decimal import Decimal
+
+import orjson
+from django.utils.translation import gettext_lazy as _
+from rest_framework.utils.serializer_helpers import ReturnDict, ReturnList
+
+from onlinefem.utils.renderers import OrjsonRenderer
+
+
+def test_render_default_fallback():
+    data = ReturnDict(
+        {
+            "name": _("Name"),
+            "value": Decimal("1.5"),
+            "items": ReturnList([_("Item")], serializer=None),
+        },
+        serializer=None,
+    )
+
+    content = OrjsonRenderer().render(data)
+
+    assert orjson.loads(content) == {"name": "Name", "value": 1.5, "items": ["Item"]}
+
+
+def test_render_indent():
+    content = OrjsonRenderer().render({"a": [1]}, "application/json; indent=4")
+
+    assert b"\n" in content
+    assert orjson.loads(content) == {"a": [1]}
+
+
+def test_render_none():
+    assert OrjsonRenderer().render(None) == b""
+
+
+def test_render_int_keys():
+    content = OrjsonRenderer().render({"items": {0: ["This field is required."]}})
+
+    assert orjson.loads(content) == {"items": {"0": ["This field is required."]}}
+
+
+def test_render_escapes_line_separators():
+    content = OrjsonRenderer().render({"a": "x\u2028y\u2029z"})
+
+    assert content == b'{"a":"x\\u2028y\\u2029z"}'
+    assert orjson.loads(content) == {"a": "x\u2028y\u2029z"}
+
+
+def test_render_nan():
+    assert orjson.loads(OrjsonRenderer().render({"a": float("nan")})) == {"a": None}
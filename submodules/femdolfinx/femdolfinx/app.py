@@ -22,8 +22,10 @@ def index():
         CellType.triangle, dolfinx.cpp.mesh.GhostMode.none)
     d = {"numbers": list(range(10)), 'method': request.method}
     if request.method == 'POST':
-        data = request.form
-        name = data['name']
+        data = request.get_json(silent=True)
+        if not isinstance(data, dict):
+            data = {}
+        name = data.get('name')
         d = None
         if name == "numbers":
             d = {"numbers": list(range(10)), 'method': request.method}